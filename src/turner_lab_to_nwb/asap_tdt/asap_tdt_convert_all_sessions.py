@@ -7,6 +7,7 @@ from neuroconv.tools.data_transfers import automatic_dandi_upload
 from neuroconv.utils import FolderPathType, FilePathType
 from nwbinspector.inspector_tools import save_report, format_messages
 from tqdm import tqdm
+from tqdm.contrib.concurrent import process_map
 
 from turner_lab_to_nwb.asap_tdt.asap_tdt_convert_session import session_to_nwb
 from turner_lab_to_nwb.asap_tdt.utils import load_session_metadata
@@ -18,6 +19,11 @@ warnings.filterwarnings(
 )
 
 
+def _session_to_nwb(session_to_nwb_kwargs: dict) -> list:
+    """Unpack the arguments of a single session, process_map passes one item of the iterable to the workers."""
+    return session_to_nwb(**session_to_nwb_kwargs)
+
+
 def convert_sessions(
     folder_path: FolderPathType,
     data_list_file_path: FilePathType,
@@ -25,6 +31,7 @@ def convert_sessions(
     gpi_only: bool = False,
     overwrite: bool = False,
     stub_test: bool = False,
+    max_workers: int = 1,
     verbose: bool = True,
 ):
     """
@@ -42,6 +49,10 @@ def convert_sessions(
         Whether to convert only the GPI sessions, default is False.
     overwrite : bool, default: False
         Whether to overwrite the NWB files if they already exist, default is False.
+    stub_test : bool, default: False
+        Whether to only convert a stub of each session, default is False.
+    max_workers : int, default: 1
+        The number of processes to convert the sessions in parallel, default is 1 (converts sessions serially).
     verbose: bool, default: True
         Controls verbosity, default is True.
     """
@@ -58,22 +69,20 @@ def convert_sessions(
         sessions_metadata = sessions_metadata[sessions_metadata["Target"].eq("GPi")]
     # filter out NaN values
     sessions_metadata = sessions_metadata[sessions_metadata["Target"] != "NaN"]
-    progress_bar = tqdm(
-        enumerate(tdt_tank_file_paths),
-        desc=f"Converting {len(tdt_tank_file_paths)} sessions",
-        position=0,
-        total=len(tdt_tank_file_paths),
-    )
+    # group the metadata by session once instead of filtering the whole table for every session
+    sessions_metadata_per_session = dict(list(sessions_metadata.groupby("Filename")))
 
-    all_sessions_inspector_results = []
-    for tank_file_ind, tdt_tank_file_path in progress_bar:
+    # Collect the conversion options of each session first, the sessions are then converted independently
+    sessions_to_convert = []
+    sessions_without_events_file = []
+    for tdt_tank_file_path in tdt_tank_file_paths:
         tdt_tank_file_name = tdt_tank_file_path.stem
 
         subject_id = "Isis" if "I" in tdt_tank_file_name.split("_") else "Gaia"
         session_id = tdt_tank_file_path.stem.replace("Gaia_", "")
 
-        session_metadata = sessions_metadata[sessions_metadata["Filename"] == session_id]
-        if session_metadata.empty:
+        session_metadata = sessions_metadata_per_session.get(session_id)
+        if session_metadata is None:
             print(f"Session {session_id} of subject {subject_id} is skipped because of empty metadata ...")
             continue
 
@@ -88,7 +97,8 @@ def convert_sessions(
         # find the files
         events_file_paths = list(tdt_tank_file_path.parent.glob(f"{session_id}.mat"))
         if not events_file_paths:
-            raise FileNotFoundError(f"No events file found for session {session_id} of subject {subject_id}.")
+            sessions_without_events_file.append(f"session {session_id} of subject {subject_id}")
+            continue
         events_file_path = str(events_file_paths[0])
 
         flt_file_paths = list(tdt_tank_file_path.parent.glob(f"{session_id}_Chans*.flt.mat"))
@@ -110,24 +120,59 @@ def convert_sessions(
                 print(f"No plexon file found for session {session_id} of subject {subject_id}.")
                 plexon_file_paths = None
 
-        progress_bar.set_description(f"\nConverting session {session_id} of subject {subject_id}")
-
-        session_inspector_results = session_to_nwb(
-            nwbfile_path=str(nwbfile_path),
-            tdt_tank_file_path=str(tdt_tank_file_path),
-            subject_id=subject_id,
-            session_id=session_id,
-            session_metadata=session_metadata,
-            events_file_path=events_file_path,
-            gpi_only=gpi_only,
-            flt_file_path=flt_file_paths,
-            plexon_file_path=plexon_file_paths,
-            target_name_mapping=target_name_mapping,
-            stub_test=stub_test,
-            verbose=verbose,
+        sessions_to_convert.append(
+            dict(
+                nwbfile_path=str(nwbfile_path),
+                tdt_tank_file_path=str(tdt_tank_file_path),
+                subject_id=subject_id,
+                session_id=session_id,
+                session_metadata=session_metadata,
+                events_file_path=events_file_path,
+                gpi_only=gpi_only,
+                flt_file_path=flt_file_paths,
+                plexon_file_path=plexon_file_paths,
+                target_name_mapping=target_name_mapping,
+                stub_test=stub_test,
+                verbose=verbose,
+            )
         )
 
-        all_sessions_inspector_results.extend(session_inspector_results)
+    # Report every missing events file at once, before any session is converted
+    if sessions_without_events_file:
+        raise FileNotFoundError(f"No events file found for {', '.join(sessions_without_events_file)}.")
+
+    all_sessions_inspector_results = []
+    if max_workers == 1:
+        progress_bar = tqdm(
+            sessions_to_convert,
+            desc=f"Converting {len(sessions_to_convert)} sessions",
+            position=0,
+            total=len(sessions_to_convert),
+            mininterval=1.0,
+            smoothing=0,
+        )
+        for session_to_nwb_kwargs in progress_bar:
+            session_id = session_to_nwb_kwargs["session_id"]
+            subject_id = session_to_nwb_kwargs["subject_id"]
+            # Do not force a redraw, so that the bar is only refreshed as often as mininterval allows
+            progress_bar.set_description(f"\nConverting session {session_id} of subject {subject_id}", refresh=False)
+
+            session_inspector_results = session_to_nwb(**session_to_nwb_kwargs)
+            all_sessions_inspector_results.extend(session_inspector_results)
+    else:
+        # The sessions share no state (separate source files and output NWB files), convert them in parallel
+        sessions_inspector_results = process_map(
+            _session_to_nwb,
+            sessions_to_convert,
+            max_workers=max_workers,
+            chunksize=1,
+            desc=f"Converting {len(sessions_to_convert)} sessions",
+            position=0,
+            mininterval=1.0,
+            smoothing=0,
+        )
+        for session_inspector_results in sessions_inspector_results:
+            all_sessions_inspector_results.extend(session_inspector_results)
 
     report_path = output_folder_path / "inspector_result.txt"
     save_report(
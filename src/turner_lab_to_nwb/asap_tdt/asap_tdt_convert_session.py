@@ -1,4 +1,6 @@
-from datetime import datetime
+from copy import deepcopy
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -6,7 +8,6 @@ import pandas as pd
 from dateutil import tz
 from neuroconv.utils import FilePathType, load_dict_from_file, dict_deep_update
 from nwbinspector import inspect_nwbfile
-from pymatreader import read_mat
 
 from turner_lab_to_nwb.asap_tdt import ASAPTdtNWBConverter
 from turner_lab_to_nwb.asap_tdt.interfaces import (
@@ -18,7 +19,21 @@ from turner_lab_to_nwb.asap_tdt.interfaces import (
     ASAPTdtMultiFileFilteredRecordingInterface,
 )
 
-from turner_lab_to_nwb.asap_tdt.utils import load_units_dataframe
+from turner_lab_to_nwb.asap_tdt.utils import load_units_dataframe, load_mat
+
+# The folder of the editable metadata files and the time zone of the recordings, shared by all sessions
+METADATA_FOLDER_PATH = Path(__file__).parent / "metadata"
+SESSION_TIMEZONE = tz.gettz("US/Pacific")
+
+
+@lru_cache(maxsize=None)
+def _load_metadata_file(file_name: str) -> dict:
+    return load_dict_from_file(METADATA_FOLDER_PATH / file_name)
+
+
+def _load_metadata(file_name: str) -> dict:
+    """Load a yaml file from the metadata folder, the file is parsed once and each session gets its own copy."""
+    return deepcopy(_load_metadata_file(file_name))
 
 
 def session_to_nwb(
@@ -40,6 +55,12 @@ def session_to_nwb(
     conversion_options = dict()
 
     channel_metadata = session_metadata.to_dict(orient="list")
+    # Group the channels by target once, used when the filtered and sorted data are split into files per target
+    session_metadata_per_target = dict(list(session_metadata.groupby("Target")))
+    channel_ids = {
+        target_name: metadata_per_target["Chan#"].tolist()
+        for target_name, metadata_per_target in session_metadata_per_target.items()
+    }
 
     # Temporary until TDT files are fixed that have missing "StoreName" header key error.
     try:
@@ -61,7 +82,8 @@ def session_to_nwb(
 
     # Check 'units' structure in the events file
     # Sometimes the events file does not contain the 'units' structure, so we need to check if it exists
-    events_mat = read_mat(events_file_path)
+    # The parsed file is cached by 'load_mat', so this reuses the content already read by the events interface
+    events_mat = load_mat(file_path=events_file_path)
     has_units = False
     if "units" in events_mat:
         units_df = load_units_dataframe(mat=events_mat)
@@ -97,11 +119,10 @@ def session_to_nwb(
         # For files that contain the "Ch_" string in the name, they contain only one channel per file
         elif "Ch_" in str(flt_file_path[0]):
             # When there are multiple flt files, we need to match the target to the flt file
-            channel_ids = session_metadata.groupby("Target")["Chan#"].apply(list).to_dict()
             for target_name, channels in channel_ids.items():
                 file_paths = [str(file) for chan in channels for file in flt_file_path if f"Ch_{chan}.flt" in file.stem]
                 assert len(file_paths) == len(channels), f"Could not find flt file for channels {channels}."
-                channel_metadata_per_target = session_metadata[session_metadata["Target"] == target_name]
+                channel_metadata_per_target = session_metadata_per_target[target_name]
                 processed_recording_source_data = dict(
                     file_paths=file_paths,
                     channel_metadata=channel_metadata_per_target.to_dict(orient="list"),
@@ -117,7 +138,6 @@ def session_to_nwb(
         # When there are multiple flt files (but they contain more than one channel), we need to match the channel names in the file name to the channel metadata
         else:
             # When there are multiple flt files, we need to match the target to the flt file
-            channel_ids = session_metadata.groupby("Target")["Chan#"].apply(list).to_dict()
             # we have to check that both channels are present in the flt file name
             channels_from_flt_name = [file.stem.replace(".flt", "").split("_")[-2:] for file in flt_file_path]
             channel_ranges = [range(int(channels[0]), int(channels[1]) + 1) for channels in channels_from_flt_name]
@@ -128,7 +148,7 @@ def session_to_nwb(
                     if all(int(chan) in channel_range for chan in channels):
                         flt_file_path_per_target = flt_file_path[ind]
                         break
-                channel_metadata_per_target = session_metadata[session_metadata["Target"] == target_name]
+                channel_metadata_per_target = session_metadata_per_target[target_name]
                 assert flt_file_path_per_target is not None, f"Could not find flt file for channels {channels}."
 
                 processed_recording_source_data = dict(
@@ -159,7 +179,6 @@ def session_to_nwb(
                 # Skip the session if there is no sorting data inside the plexon file
                 print(f"Error in plexon sorting interface for session {plexon_file_path}: {e}")
         else:
-            channel_ids = session_metadata.groupby("Target")["Chan#"].apply(list).to_dict()
             channels_from_plx_name = [file.stem.split("_")[-2:] for file in plexon_file_path]
             channel_ranges = [range(int(channels[0]), int(channels[1]) + 1) for channels in channels_from_plx_name]
             # match target to plexon file
@@ -172,7 +191,7 @@ def session_to_nwb(
                 if plexon_file_path_per_target is None:
                     print(f"Could not find plexon file for channels {channels}.")
                     continue
-                channel_metadata_per_target = session_metadata[session_metadata["Target"] == target_name]
+                channel_metadata_per_target = session_metadata_per_target[target_name]
                 try:
                     plexon_sorting_interface = ASAPTdtPlexonSortingInterface(
                         file_path=plexon_file_path_per_target,
@@ -195,7 +214,6 @@ def session_to_nwb(
     metadata = converter.get_metadata()
     # For data provenance we can add the time zone information to the conversion if missing
     session_start_time = metadata["NWBFile"]["session_start_time"]
-    tzinfo = tz.gettz("US/Pacific")
 
     # Add tag to the session_id
     tag = "pre_MPTP" if "pre_MPTP" in Path(tdt_tank_file_path).parts else "post_MPTP"
@@ -203,18 +221,17 @@ def session_to_nwb(
     session_id_with_tag = session_id_with_tag.replace("_", "-")  # e.g. pre-MPTP-I-160818-4
     metadata["NWBFile"].update(
         session_id=session_id_with_tag,
-        session_start_time=session_start_time.replace(tzinfo=tzinfo),
+        session_start_time=session_start_time.replace(tzinfo=SESSION_TIMEZONE),
     )
 
     # Update default metadata with the editable in the corresponding yaml file
     general_metadata = f"{tag}_GPi_only_metadata.yaml" if gpi_only else f"{tag}_metadata.yaml"
-    editable_metadata_path = Path(__file__).parent / "metadata" / general_metadata
-    editable_metadata = load_dict_from_file(editable_metadata_path)
-    metadata = dict_deep_update(metadata, editable_metadata)
+    editable_metadata = _load_metadata(general_metadata)
+    # The metadata is built for this session only, update it in place instead of deep copying it on every merge
+    metadata = dict_deep_update(metadata, editable_metadata, copy=False)
 
     # Load subject metadata from the yaml file
-    subject_metadata_path = Path(__file__).parent / "metadata" / "subjects_metadata.yaml"
-    subject_metadata = load_dict_from_file(subject_metadata_path)
+    subject_metadata = _load_metadata("subjects_metadata.yaml")
     subject_metadata = subject_metadata["Subject"][subject_id]
 
     # Add pharmacology metadata for post_MPTP sessions
@@ -224,16 +241,19 @@ def session_to_nwb(
 
     metadata["Subject"].update(**subject_metadata)
     date_of_birth = metadata["Subject"]["date_of_birth"]
-    date_of_birth_dt = datetime.strptime(date_of_birth, "%Y-%m-%d")
-    metadata["Subject"].update(date_of_birth=date_of_birth_dt.replace(tzinfo=tzinfo))
+    # The YAML loader parses unquoted ISO dates into datetime.date, a quoted date stays a string
+    if isinstance(date_of_birth, str):
+        date_of_birth = date.fromisoformat(date_of_birth)
+    date_of_birth_dt = datetime.combine(date_of_birth, datetime.min.time(), tzinfo=SESSION_TIMEZONE)
+    metadata["Subject"].update(date_of_birth=date_of_birth_dt)
 
     # Load ecephys metadata
-    ecephys_metadata = load_dict_from_file(Path(__file__).parent / "metadata" / "ecephys_metadata.yaml")
+    ecephys_metadata = _load_metadata("ecephys_metadata.yaml")
     has_sorting = any("Sorting" in data_interface_name for data_interface_name in data_interfaces.keys())
     if not has_sorting:
         # Remove unit metadata when no unit data is present for the session
         ecephys_metadata["Ecephys"].pop("UnitProperties")
-    metadata = dict_deep_update(metadata, ecephys_metadata)
+    metadata = dict_deep_update(metadata, ecephys_metadata, copy=False)
 
     metadata["LabMetaData"] = dict(name="MPTPMetaData", MPTP_status=tag)
 
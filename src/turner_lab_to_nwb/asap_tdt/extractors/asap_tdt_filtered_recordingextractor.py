@@ -26,7 +26,8 @@ class ASAPTdtFilteredRecordingExtractor(BaseRecording):
         file_path = Path(file_path)
         assert file_path.exists(), f"The file {file_path} does not exist."
 
-        fft_data = read_mat(file_path)
+        # Only the sampling rate and the filtered traces are needed, skip parsing any other variable in the file
+        fft_data = read_mat(file_path, variable_names=["samplerate", "hp_cont"])
         assert "samplerate" in fft_data, f"The file {file_path} does not contain a 'samplerate' key."
         assert "hp_cont" in fft_data, f"The file {file_path} does not contain a 'hp_cont' key."
 
@@ -100,27 +101,58 @@ class ASAPTdtMultiFileFilteredRecordingExtractor(BaseRecording):
         super().__init__(sampling_frequency, channel_ids, dtype)
 
         rec_segment = ASAPTdtMultiFileFilteredRecordingSegment(
-            sampling_frequency=sampling_frequency, file_paths=file_paths, num_samples=num_samples
+            sampling_frequency=sampling_frequency, file_paths=file_paths, num_samples=num_samples, dtype=dtype
         )
         self.add_recording_segment(rec_segment)
 
 
 class ASAPTdtMultiFileFilteredRecordingSegment(BaseRecordingSegment):
-    def __init__(self, sampling_frequency: float, file_paths: list, num_samples: int, t_start: Optional[float] = None):
+    def __init__(
+        self,
+        sampling_frequency: float,
+        file_paths: list,
+        num_samples: int,
+        dtype=np.float64,
+        t_start: Optional[float] = None,
+    ):
         super().__init__(sampling_frequency=sampling_frequency, t_start=t_start)
 
         self.file_paths = file_paths
         self.num_channels = len(file_paths)
         self.num_samples = num_samples
+        self.dtype = dtype
+        self._files = None
+        self._datasets = None
 
-    def _concatenate_over_channels(self, start_frame=None, end_frame=None):
+    def _get_datasets(self) -> list:
+        """Open the 'hp_cont' dataset of each file once and reuse the handles for every chunk that is read."""
         import h5py
 
-        data = []
-        for file_path in self.file_paths:
-            with h5py.File(str(file_path), "r") as f:
-                data.append(f["hp_cont"][:, start_frame:end_frame])
-        return np.concatenate(data, axis=0)
+        if self._datasets is None:
+            self._files = [h5py.File(str(file_path), "r") for file_path in self.file_paths]
+            self._datasets = [file["hp_cont"] for file in self._files]
+        return self._datasets
+
+    def close(self):
+        """Close the files opened by '_get_datasets'."""
+        # The attribute is missing when the segment failed to initialize
+        if getattr(self, "_files", None) is not None:
+            for file in self._files:
+                file.close()
+        self._files = None
+        self._datasets = None
+
+    def __del__(self):
+        self.close()
+
+    def _concatenate_over_channels(self, start_frame=None, end_frame=None):
+        # Each file holds a single channel, write them into the columns of a preallocated (frames x channels)
+        # buffer instead of concatenating the per-file arrays and transposing the result
+        traces = np.empty((end_frame - start_frame, self.num_channels), dtype=self.dtype)
+        for channel_index, dataset in enumerate(self._get_datasets()):
+            # Read straight into the column of the buffer without an intermediate array
+            dataset.read_direct(traces, source_sel=np.s_[0, start_frame:end_frame], dest_sel=np.s_[:, channel_index])
+        return traces
 
     def get_traces(self, start_frame=None, end_frame=None, channel_indices=None):
         if start_frame is None:
@@ -130,7 +162,7 @@ class ASAPTdtMultiFileFilteredRecordingSegment(BaseRecordingSegment):
         if channel_indices is None:
             channel_indices = slice(None)
 
-        data = np.transpose(self._concatenate_over_channels(start_frame, end_frame), (1, 0))
+        data = self._concatenate_over_channels(start_frame, end_frame)
         return data[:, channel_indices]
 
     def get_num_samples(self) -> int:
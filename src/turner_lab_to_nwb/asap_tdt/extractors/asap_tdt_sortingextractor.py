@@ -1,11 +1,19 @@
 from typing import Optional
 import numpy as np
-from pymatreader import read_mat
 from spikeinterface import BaseSorting, BaseSortingSegment
 
 from neuroconv.utils import FilePathType
 
-from turner_lab_to_nwb.asap_tdt.utils import load_units_dataframe
+from turner_lab_to_nwb.asap_tdt.utils import load_units_dataframe, load_mat
+
+
+# Map unit quality values to more descriptive names
+QUALITY_VALUES_MAPPING = {
+    "A": "excellent",
+    "B": "good",
+    "A -> B": "changed to good from excellent based on post-sorting quality",
+    "B -> A": "changed to excellent from good based on post-sorting quality",
+}
 
 
 class ASAPTdtSortingExtractor(BaseSorting):
@@ -25,7 +33,7 @@ class ASAPTdtSortingExtractor(BaseSorting):
             Determines whether to load only GPi units, by default True.
         """
 
-        mat = read_mat(file_path)
+        mat = load_mat(file_path=file_path)
         assert "units" in mat, f"The 'units' structure is missing from '{file_path}'."
 
         units_df = load_units_dataframe(mat=mat)
@@ -48,7 +56,7 @@ class ASAPTdtSortingExtractor(BaseSorting):
             sampling_frequency = float(mat["samplerate"])
         elif "ChanFS" in mat["Tanksummary"]:
             channel_names = mat["Tanksummary"]["ChanName"]
-            channel_index = np.where(np.array(channel_names) == "Conx")[0]
+            channel_index = np.where(np.asarray(channel_names) == "Conx")[0]
             sampling_frequency = float(mat["Tanksummary"]["ChanFS"][channel_index])
         else:
             raise ValueError(f"Cannot determine sampling frequency from '{file_path}'.")
@@ -60,17 +68,10 @@ class ASAPTdtSortingExtractor(BaseSorting):
         )
         self.add_sorting_segment(sorting_segment)
 
-        # Map unit quality values to more descriptive names
-        quality_values_map = {
-            "A": "excellent",
-            "B": "good",
-            "A -> B": "changed to good from excellent based on post-sorting quality",
-            "B -> A": "changed to excellent from good based on post-sorting quality",
-        }
         if "sort_qual" in units_df and any(units_df["sort_qual"]):
             units_quality = units_df["sort_qual"].values.tolist()
             units_quality_renamed = [
-                quality_values_map.get(quality, quality) if quality else "no quality" for quality in units_quality
+                QUALITY_VALUES_MAPPING.get(quality, quality) if quality else "no quality" for quality in units_quality
             ]
             self.set_property(key="unit_quality_post_sorting", values=units_quality_renamed)
 
@@ -83,9 +84,9 @@ class ASAPTdtSortingExtractor(BaseSorting):
 
             # Rename non-unique unit names
             duplicates_mask = units_df["uname"].duplicated(keep=False)
-            for i, row in units_df.iterrows():
-                if duplicates_mask[i]:
-                    units_df.at[i, "uname"] = f'{row["uname"]}-{row["chan"]}'
+            units_df.loc[duplicates_mask, "uname"] = (
+                units_df.loc[duplicates_mask, "uname"] + "-" + units_df.loc[duplicates_mask, "chan"].astype(str)
+            )
 
         unit_properties_mapping = dict(
             sort="sort_label",
@@ -102,7 +103,8 @@ class ASAPTdtSortingExtractor(BaseSorting):
 class ASAPTdtSortingSegment(BaseSortingSegment):
     def __init__(self, sampling_frequency: float, spike_times: np.ndarray):
         BaseSortingSegment.__init__(self)
-        self._spike_times = spike_times
+        # Sort the spike times of each unit once, so that the frame range can be sliced with searchsorted
+        self._spike_times = [np.sort(times, axis=None) for times in spike_times]
         self._sampling_frequency = sampling_frequency
 
     def get_unit_spike_train(
@@ -114,7 +116,7 @@ class ASAPTdtSortingSegment(BaseSortingSegment):
         times = self._spike_times[unit_id]
         frames = (times * self._sampling_frequency).astype(int)
         if start_frame is not None:
-            frames = frames[frames >= start_frame]
+            frames = frames[np.searchsorted(frames, start_frame, side="left") :]
         if end_frame is not None:
-            frames = frames[frames < end_frame]
+            frames = frames[: np.searchsorted(frames, end_frame, side="left")]
         return frames
@@ -5,9 +5,33 @@ from typing import Optional
 import numpy as np
 from neuroconv import BaseDataInterface
 from neuroconv.utils import FilePathType, DeepDict
-from pymatreader import read_mat
 from pynwb import NWBFile
 
+from turner_lab_to_nwb.asap_tdt.utils import load_mat
+
+
+# Use more descriptive names for the event types
+EVENT_NAMES_MAPPING = dict(
+    erroron="error_onset_time",
+    rewardon="reward_start_time",
+    rewardoff="reward_stop_time",
+    mvt_onset="movement_start_time",
+    mvt_end="movement_stop_time",
+    return_onset="return_start_time",
+    return_end="return_stop_time",
+    cue_onset="cue_onset_time",
+)
+EVENTS_DESCRIPTION_MAPPING = dict(
+    erroron="The times of the error onset.",
+    rewardon="The times of the reward onset.",
+    rewardoff="The times of the reward offset.",
+    mvt_onset="The times of the hand sensor at the home-position off (= onset of the movement).",
+    mvt_end="The times of the hand sensor at the reach target on (= end of the movement).",
+    return_onset="The times of the hand sensor at the reach target off (= onset of the return movement)",
+    return_end="The times of the hand sensor at the home-position on (= end of the return movement)",
+    cue_onset="The times of the target and go-cue instruction (reach target and go-cue were instructed simulatneously in this task).",
+)
+
 
 class ASAPTdtEventsInterface(BaseDataInterface):
     """Events interface for asap_tdt conversion"""
@@ -25,7 +49,7 @@ class ASAPTdtEventsInterface(BaseDataInterface):
         assert file_path.exists(), f"File {file_path} does not exist."
         self.file_path = file_path
         self.verbose = verbose
-        self._events_data = read_mat(filename=str(self.file_path))
+        self._events_data = load_mat(file_path=self.file_path)
 
     def get_metadata(self) -> DeepDict:
         metadata = super().get_metadata()
@@ -75,35 +99,13 @@ class ASAPTdtEventsInterface(BaseDataInterface):
                 stop_time=trial_stop_time,
             )
 
-        # Use more descriptive names for the event types
-        event_names_mapping = dict(
-            erroron="error_onset_time",
-            rewardon="reward_start_time",
-            rewardoff="reward_stop_time",
-            mvt_onset="movement_start_time",
-            mvt_end="movement_stop_time",
-            return_onset="return_start_time",
-            return_end="return_stop_time",
-            cue_onset="cue_onset_time",
-        )
-        events_description_mapping = dict(
-            erroron="The times of the error onset.",
-            rewardon="The times of the reward onset.",
-            rewardoff="The times of the reward offset.",
-            mvt_onset="The times of the hand sensor at the home-position off (= onset of the movement).",
-            mvt_end="The times of the hand sensor at the reach target on (= end of the movement).",
-            return_onset="The times of the hand sensor at the reach target off (= onset of the return movement)",
-            return_end="The times of the hand sensor at the home-position on (= end of the return movement)",
-            cue_onset="The times of the target and go-cue instruction (reach target and go-cue were instructed simulatneously in this task).",
-        )
-
-        for event_name, mapped_event_name in event_names_mapping.items():
+        for event_name, mapped_event_name in EVENT_NAMES_MAPPING.items():
             # if event is missing or event type contains only NaNs, skip it
             if event_name not in events or np.isnan(events[event_name]).all():
                 continue
             nwbfile.add_trial_column(
                 name=mapped_event_name,
-                description=events_description_mapping[event_name],
+                description=EVENTS_DESCRIPTION_MAPPING[event_name],
                 data=events[event_name],
             )
 
@@ -118,13 +118,13 @@ class ASAPTdtRecordingInterface(BaseRecordingExtractorInterface):
 
         electrode_groups = []
         unique_electrodes_data = self._electrode_metadata.groupby("Area").first()
-        for location, data in unique_electrodes_data.iterrows():
+        for data in unique_electrodes_data.itertuples():
             electrode_groups.append(
                 dict(
-                    name=f'Group {data["Target"]}',
-                    description=f"Group {data['Electrode']} electrodes.",
+                    name=f"Group {data.Target}",
+                    description=f"Group {data.Electrode} electrodes.",
                     device=ecephys_metadata["Device"][0]["name"],
-                    location=location,
+                    location=data.Index,
                 )
             )
         ecephys_metadata.update(ElectrodeGroup=electrode_groups)
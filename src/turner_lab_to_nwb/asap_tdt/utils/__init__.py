@@ -1,2 +1,3 @@
 from .load_data_list import load_session_metadata
+from .load_mat import load_mat
 from .units import load_units_dataframe
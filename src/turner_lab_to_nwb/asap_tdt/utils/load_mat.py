@@ -0,0 +1,25 @@
+from functools import lru_cache
+from pathlib import Path
+
+from neuroconv.utils import FilePathType
+from pymatreader import read_mat
+
+
+def load_mat(file_path: FilePathType) -> dict:
+    """
+    Load the MAT file, reusing the parsed content when the same file was the last one to be loaded.
+
+    The events file of a session is read by both the events and the sorting interface, this avoids parsing it twice.
+    The returned dictionary is shared between the callers and should not be modified.
+
+    Parameters
+    ----------
+    file_path : FilePathType
+        The path to the MAT file.
+    """
+    return _read_mat(str(Path(file_path)))
+
+
+@lru_cache(maxsize=1)
+def _read_mat(file_path: str) -> dict:
+    return read_mat(filename=file_path)
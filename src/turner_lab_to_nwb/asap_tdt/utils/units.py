@@ -31,7 +31,7 @@ def load_units_dataframe(mat: dict) -> pd.DataFrame:
             if isinstance(mat["Cont_Channel_Location"], str)
             else mat["Cont_Channel_Location"]
         )
-        brain_areas = np.array(brain_areas)
+        brain_areas = np.asarray(brain_areas)
         if len(unique_channel_indices) != len(brain_areas):
             brain_areas = brain_areas[unique_channel_indices]
         channel_to_location_mapping = dict(zip(unique_channels, brain_areas))